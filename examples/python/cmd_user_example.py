@@ -71,13 +71,10 @@ async def example_user_override():
     ) as box:
         print(f"Container started: {box.id}")
 
-        # Verify the user inside the container
-        result = await box.exec("id")
-        print(f"Container user: {result.stdout.strip()}")
-
-        # Verify uid specifically
-        result = await box.exec("id", "-u")
-        uid = result.stdout.strip()
+        # Verify the user and uid inside the container in one round trip
+        result = await box.exec("sh", "-c", "id; id -u")
+        full_id, uid = result.stdout.strip().rsplit("\n", 1)
+        print(f"Container user: {full_id}")
         print(f"UID: {uid}")
         assert uid == "1000", f"Expected UID 1000, got {uid}"
 
@@ -96,11 +93,9 @@ async def example_username_resolution():
     ) as box:
         print(f"Container started: {box.id}")
 
-        result = await box.exec("id")
-        print(f"Container user: {result.stdout.strip()}")
-
-        result = await box.exec("id", "-u")
-        uid = result.stdout.strip()
+        result = await box.exec("sh", "-c", "id; id -u")
+        full_id, uid = result.stdout.strip().rsplit("\n", 1)
+        print(f"Container user: {full_id}")
         print(f"UID: {uid}")
         assert uid == "65534", f"Expected UID 65534 (nobody), got {uid}"
 
@@ -119,11 +114,9 @@ async def example_user_group_resolution():
     ) as box:
         print(f"Container started: {box.id}")
 
-        result = await box.exec("id")
-        print(f"Container user: {result.stdout.strip()}")
-
-        result = await box.exec("id", "-g")
-        gid = result.stdout.strip()
+        result = await box.exec("sh", "-c", "id; id -g")
+        full_id, gid = result.stdout.strip().rsplit("\n", 1)
+        print(f"Container user: {full_id}")
         print(f"GID: {gid}")
         assert gid == "65534", f"Expected GID 65534 (nobody), got {gid}"
 
@@ -164,4 +157,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop is optional; when installed it replaces the default event loop
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -7,54 +7,122 @@ are invisible to the running container. This is the same limitation as
 
 The fix is the same as Docker's recommendation: pipe a tar archive through
 a command running inside the container's mount namespace, which sees tmpfs.
+stream_tar() packs in-memory files on the fly.
 
 Requirements:
   pip install boxlite
+  pip install uvloop  # optional, faster event loop
 """
 
 import asyncio
+import contextlib
 import io
+import os
 import tarfile
+import tempfile
 
 from boxlite import SimpleBox
 
-
-def make_tar(files: dict[str, bytes]) -> bytes:
-    """Create an in-memory tar archive from a dict of {path: content}."""
-    buf = io.BytesIO()
-    with tarfile.open(fileobj=buf, mode="w") as tar:
-        for name, data in files.items():
-            info = tarfile.TarInfo(name=name)
-            info.size = len(data)
-            tar.addfile(info, io.BytesIO(data))
-    return buf.getvalue()
+# tarfile defaults to 10 KiB records and 16 KiB copy buffers, which turns a
+# large file into thousands of tiny writes. Use one 2 MiB size for tar records,
+# file copies and stdin sends alike.
+CHUNK_SIZE = 2 * 1024 * 1024
+
+
+class _StdinWriter:
+    """File-like sink that forwards tar output to an execution's stdin.
+
+    tarfile only knows how to call a synchronous ``write()``, so the archive
+    is built in a worker thread and each full chunk is handed back to the
+    event loop, which blocks the writer until the guest has accepted it.
+    """
+
+    def __init__(self, stdin, loop: asyncio.AbstractEventLoop, chunk_size: int):
+        self._stdin = stdin
+        self._loop = loop
+        self._chunk_size = chunk_size
+        self._buf = bytearray()
+
+    async def _send(self, chunk: bytes):
+        await self._stdin.send_input(chunk)
+
+    def write(self, data: bytes) -> int:
+        self._buf += data
+        if len(self._buf) >= self._chunk_size:
+            self.flush()
+        return len(data)
+
+    def flush(self):
+        if self._buf:
+            chunk = bytes(self._buf)
+            self._buf.clear()
+            asyncio.run_coroutine_threadsafe(self._send(chunk), self._loop).result()
+
+
+async def stream_tar(files: dict[str, bytes], stdin, chunk_size: int = CHUNK_SIZE):
+    """Stream a tar archive of {path: content} into stdin, chunk by chunk.
+
+    Peak memory is bounded by ``chunk_size`` rather than the archive size.
+    """
+    writer = _StdinWriter(stdin, asyncio.get_running_loop(), chunk_size)
+
+    def build():
+        # "w|" is tarfile's streaming mode: it never seeks on the sink.
+        with tarfile.open(
+            fileobj=writer,
+            mode="w|",
+            bufsize=chunk_size,
+            copybufsize=chunk_size,
+        ) as tar:
+            for name, data in files.items():
+                info = tarfile.TarInfo(name=name)
+                info.size = len(data)
+                tar.addfile(info, io.BytesIO(data))
+        writer.flush()
+
+    await asyncio.to_thread(build)
+
+
+@contextlib.contextmanager
+def host_file(data: bytes):
+    """Yield a host path whose contents are ``data``.
+
+    On Linux the bytes live in an anonymous memfd and are exposed through
+    /proc/self/fd, so nothing touches the disk. Elsewhere a temp file is used.
+    """
+    if hasattr(os, "memfd_create"):
+        fd = os.memfd_create("ghost", os.MFD_CLOEXEC)
+        try:
+            os.write(fd, data)
+            yield f"/proc/self/fd/{fd}"
+        finally:
+            os.close(fd)
+    else:
+        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
+            f.write(data)
+        try:
+            yield f.name
+        finally:
+            os.unlink(f.name)
 
 
 async def main():
     async with SimpleBox("alpine:latest", name="tmpfs-cp-demo") as box:
 
         # --- The problem: copy_in to /tmp silently fails ---
-        # Write a file on host, copy it into /tmp inside the container
-        import tempfile, os
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("you won't see me\n")
-            host_file = f.name
-
-        try:
-            await box.copy_in(host_file, "/tmp/ghost.txt")
-            result = await box.exec("ls", "/tmp/ghost.txt")
-            print(f"copy_in to /tmp:     exit={result.exit_code}  "
-                  f"{'FOUND' if result.exit_code == 0 else 'NOT FOUND (expected)'}")
-        finally:
-            os.unlink(host_file)
+        # Stage some bytes on the host, copy them into /tmp inside the container
+        with host_file(b"you won't see me\n") as path:
+            # The memfd path is a symlink into /proc, so follow it
+            await box.copy_in(path, "/tmp/ghost.txt", follow_symlinks=True)
+        result = await box.exec("ls", "/tmp/ghost.txt")
+        print(f"copy_in to /tmp:     exit={result.exit_code}  "
+              f"{'FOUND' if result.exit_code == 0 else 'NOT FOUND (expected)'}")
 
         # --- The workaround: pipe tar through container process ---
-        tar_data = make_tar({"hello.txt": b"visible!\n"})
-
         # Use low-level API to get stdin access (like: docker exec -i ... tar xf -)
         execution = await box._box.exec("tar", args=["xf", "-", "-C", "/tmp"])
         stdin = execution.stdin()
-        await stdin.send_input(tar_data)
+        await stream_tar({"hello.txt": b"visible!\n"}, stdin)
         await stdin.close()
         result = await execution.wait()
         print(f"tar via stdin:       exit={result.exit_code}")
@@ -64,4 +132,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop is optional; when installed it replaces the default event loop
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
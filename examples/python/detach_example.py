@@ -16,6 +16,13 @@ import asyncio
 import boxlite
 
 
+async def stop_and_remove(runtime, box):
+    """Stop a preserved (auto_remove=False) box, then remove it."""
+    box_id = box.id
+    await box.stop()
+    await runtime.remove(box_id, force=False)
+
+
 async def demo_auto_remove_true():
     """Demo auto_remove=True behavior (default).
 
@@ -58,7 +65,6 @@ async def demo_auto_remove_true():
     if info is None:
         print("   Box was automatically removed!")
 
-    runtime.close()
     print("\nDemo 1 completed.\n")
 
 
@@ -109,13 +115,11 @@ async def demo_auto_remove_false():
 
         # Clean up - stop then remove
         print("\n6. Cleaning up (stop + remove)...")
-        await restarted_box.stop()
-        await runtime.remove(box_id, force=False)
+        await stop_and_remove(runtime, restarted_box)
         print("   Box removed")
     else:
         print("   Failed to get box handle")
 
-    runtime.close()
     print("\nDemo 2 completed.\n")
 
 
@@ -153,7 +157,6 @@ async def demo_detach_false():
     await box.stop()
     print("   Box stopped and auto-removed")
 
-    runtime.close()
     print("\nDemo 3 completed.\n")
 
 
@@ -197,11 +200,9 @@ async def demo_detach_true():
 
     # Clean up for demo
     print("\n4. Cleaning up...")
-    await box.stop()
-    await runtime.remove(box_id, force=False)
+    await stop_and_remove(runtime, box)
     print("   Box stopped and removed")
 
-    runtime.close()
     print("\nDemo 4 completed.\n")
 
 
@@ -212,57 +213,79 @@ async def demo_combined_options():
 
     runtime = boxlite.Boxlite.default()
 
-    # Combination 1: auto_remove=True, detach=False (default)
-    # Use case: Ephemeral sandbox for one-off tasks
-    print("1. Ephemeral sandbox (auto_remove=True, detach=False):")
-    print("   Use case: One-off code execution, testing")
-    box1 = await runtime.create(boxlite.BoxOptions(
-        image="alpine:latest",
-        auto_remove=True,
-        detach=False,
-    ))
-    result = await box1.exec("echo", ["One-off task"])
-    print(f"   Output: {result.stdout()}")
-    await box1.stop()
-    print("   Box auto-removed on stop\n")
-
-    # Combination 2: auto_remove=False, detach=False
-    # Use case: Development/debugging - restart box with same state
-    print("2. Development sandbox (auto_remove=False, detach=False):")
-    print("   Use case: Iterative development, debugging")
-    box2 = await runtime.create(boxlite.BoxOptions(
-        image="alpine:latest",
-        auto_remove=False,
-        detach=False,
-    ))
-    box2_id = box2.id
-    await box2.exec("touch", ["/tmp/dev-file"])
-    await box2.stop()
-    # Can restart and continue development
-    box2_restarted = await runtime.get(box2_id)
-    result = await box2_restarted.exec("ls", ["/tmp/dev-file"])
-    print(f"   File persisted: '/tmp/dev-file' in {result.stdout()}")
-    await box2_restarted.stop()
-    await runtime.remove(box2_id)
-    print("   Box manually removed\n")
-
-    # Combination 3: auto_remove=False, detach=True
-    # Use case: Long-running service that survives parent exit
-    print("3. Background service (auto_remove=False, detach=True):")
-    print("   Use case: Long-running services, daemons")
-    box3 = await runtime.create(boxlite.BoxOptions(
-        image="alpine:latest",
-        auto_remove=False,
-        detach=True,
-    ))
-    box3_id = box3.id
-    print(f"   Service box: {box3_id}")
-    print("   This box would survive parent process exit")
-    await box3.stop()
-    await runtime.remove(box3_id)
-    print("   Box manually stopped and removed\n")
-
-    runtime.close()
+    # The three boxes are independent, so boot them concurrently instead of
+    # paying one cold start after another.
+    box1, box2, box3 = await asyncio.gather(
+        # Combination 1: auto_remove=True, detach=False (default)
+        # Use case: Ephemeral sandbox for one-off tasks
+        runtime.create(boxlite.BoxOptions(
+            image="alpine:latest",
+            auto_remove=True,
+            detach=False,
+        )),
+        # Combination 2: auto_remove=False, detach=False
+        # Use case: Development/debugging - restart box with same state
+        runtime.create(boxlite.BoxOptions(
+            image="alpine:latest",
+            auto_remove=False,
+            detach=False,
+        )),
+        # Combination 3: auto_remove=False, detach=True
+        # Use case: Long-running service that survives parent exit
+        runtime.create(boxlite.BoxOptions(
+            image="alpine:latest",
+            auto_remove=False,
+            detach=True,
+        )),
+    )
+
+    # Each scenario collects its output so the report below stays readable
+    # even though the scenarios run concurrently.
+    async def ephemeral_sandbox():
+        lines = [
+            "1. Ephemeral sandbox (auto_remove=True, detach=False):",
+            "   Use case: One-off code execution, testing",
+        ]
+        result = await box1.exec("echo", ["One-off task"])
+        lines.append(f"   Output: {result.stdout()}")
+        await box1.stop()
+        lines.append("   Box auto-removed on stop\n")
+        return lines
+
+    async def development_sandbox():
+        lines = [
+            "2. Development sandbox (auto_remove=False, detach=False):",
+            "   Use case: Iterative development, debugging",
+        ]
+        await box2.exec("touch", ["/tmp/dev-file"])
+        await box2.stop()
+        # Can restart and continue development
+        box2_restarted = await runtime.get(box2.id)
+        result = await box2_restarted.exec("ls", ["/tmp/dev-file"])
+        lines.append(f"   File persisted: '/tmp/dev-file' in {result.stdout()}")
+        await stop_and_remove(runtime, box2_restarted)
+        lines.append("   Box manually removed\n")
+        return lines
+
+    async def background_service():
+        lines = [
+            "3. Background service (auto_remove=False, detach=True):",
+            "   Use case: Long-running services, daemons",
+        ]
+        lines.append(f"   Service box: {box3.id}")
+        lines.append("   This box would survive parent process exit")
+        await stop_and_remove(runtime, box3)
+        lines.append("   Box manually stopped and removed\n")
+        return lines
+
+    reports = await asyncio.gather(
+        ephemeral_sandbox(),
+        development_sandbox(),
+        background_service(),
+    )
+    for lines in reports:
+        print("\n".join(lines))
+
     print("Demo 5 completed.\n")
 
 
@@ -284,11 +307,15 @@ async def main():
     print("=" * 60)
     print()
 
-    await demo_auto_remove_true()
-    await demo_auto_remove_false()
-    await demo_detach_false()
-    await demo_detach_true()
-    await demo_combined_options()
+    # The demos use independent boxes, so run them concurrently. Their
+    # output interleaves, but total time is the slowest demo, not the sum.
+    await asyncio.gather(
+        demo_auto_remove_true(),
+        demo_auto_remove_false(),
+        demo_detach_false(),
+        demo_detach_true(),
+        demo_combined_options(),
+    )
 
     print("=" * 60)
     print("All demos completed!")
@@ -302,4 +329,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop is optional; when installed it replaces the default event loop
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
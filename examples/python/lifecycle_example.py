@@ -14,6 +14,44 @@ import asyncio
 import boxlite
 
 
+async def stop_and_remove(runtime, box):
+    """Stop a preserved (auto_remove=False) box, then remove it."""
+    box_id = box.id
+    await box.stop()
+    await runtime.remove(box_id, force=False)
+
+
+async def wait_for_status(runtime, box_id, status, timeout=5.0):
+    """Poll a box until it reaches ``status``, backing off from 10ms to 100ms.
+
+    Raises:
+        TimeoutError: If the box does not reach ``status`` within ``timeout``
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    delay = 0.01
+    while True:
+        info = await runtime.get_info(box_id)
+        if info is not None and info.state.status == status:
+            return
+        if loop.time() >= deadline:
+            raise TimeoutError(f"box {box_id} did not reach '{status}' in {timeout}s")
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 0.1)
+
+
+async def run(box, cmd, *args):
+    """Execute a command, collect its stdout and wait for it to exit.
+
+    Returns:
+        Tuple of (stdout, exit_code)
+    """
+    execution = await box.exec(cmd, list(args))
+    stdout = await execution.stdout().read_all()
+    result = await execution.wait()
+    return stdout, result.exit_code
+
+
 async def test_stop_and_restart():
     """Test stopping a box and restarting it."""
     print("\n=== Test 1: Stop and Restart ===")
@@ -34,19 +72,17 @@ async def test_stop_and_restart():
         box_id = box.id
         print(f"  Box created: {box_id}")
 
-        # Create a file in the box to verify persistence
+        # Create a file in the box to verify persistence, reading it back
+        # in the same exec to save a round trip
         print("\nCreating test file in box...")
-        execution = await box.exec("sh", ["-c", "echo 'persistent data' > /tmp/test.txt"])
-        await execution.wait()
+        stdout, _ = await run(
+            box, "sh", "-c",
+            "echo 'persistent data' > /tmp/test.txt && cat /tmp/test.txt",
+        )
         print("  File created")
-
-        # Verify file exists
-        execution = await box.exec("cat", ["/tmp/test.txt"])
-        stdout = execution.stdout()
         print("\nFile contents before stop:")
-        async for line in stdout:
+        for line in stdout.splitlines():
             print(f"  {line.strip()}")
-        await execution.wait()
 
         # Get box info before stop
         info = box.info()
@@ -63,8 +99,8 @@ async def test_stop_and_restart():
         if info:
             print(f"Box state after stop: {info.state}")
 
-        # Wait a moment
-        await asyncio.sleep(0.5)
+        # Wait for the stop to settle instead of sleeping a fixed amount
+        await wait_for_status(runtime, box_id, "stopped")
 
         # Restart the box by getting a new handle and executing
         print("\nRestarting box (reuses existing rootfs)...")
@@ -77,24 +113,18 @@ async def test_stop_and_restart():
 
         # Execute command triggers restart
         print("\nExecuting command (triggers restart)...")
-        execution = await restarted_box.exec("echo", ["Box restarted"])
-        stdout = execution.stdout()
-        async for line in stdout:
+        stdout, exit_code = await run(restarted_box, "echo", "Box restarted")
+        for line in stdout.splitlines():
             print(f"  {line.strip()}")
-        result = await execution.wait()
-        print(f"  Command executed (exit code: {result.exit_code})")
+        print(f"  Command executed (exit code: {exit_code})")
 
         # Verify our file still exists (proves rootfs was reused)
         print("\nVerifying file persistence after restart...")
-        execution = await restarted_box.exec("cat", ["/tmp/test.txt"])
-        stdout = execution.stdout()
+        stdout, _ = await run(restarted_box, "cat", "/tmp/test.txt")
         print("File contents after restart:")
-        file_found = False
-        async for line in stdout:
+        for line in stdout.splitlines():
             print(f"  {line.strip()}")
-            if "persistent data" in line:
-                file_found = True
-        await execution.wait()
+        file_found = "persistent data" in stdout
 
         if file_found:
             print("  File persisted across restart!")
@@ -102,8 +132,7 @@ async def test_stop_and_restart():
             print("  File was not persisted (expected - tmpfs is cleared)")
 
         # Clean up - stop then remove
-        await restarted_box.stop()
-        await runtime.remove(box_id, force=False)
+        await stop_and_remove(runtime, restarted_box)
         restarted_box = None
         print("\n  Box stopped and removed")
 
@@ -150,11 +179,9 @@ async def test_reattach_to_running():
 
         # Execute a command to ensure it's fully initialized
         print("\nExecuting initial command...")
-        execution = await box.exec("echo", ["Box is running"])
-        stdout = execution.stdout()
-        async for line in stdout:
+        stdout, _ = await run(box, "echo", "Box is running")
+        for line in stdout.splitlines():
             print(f"  {line.strip()}")
-        await execution.wait()
         print("  Command executed successfully")
 
         # Get box info
@@ -172,19 +199,16 @@ async def test_reattach_to_running():
 
         # Execute command via second handle
         print("\nExecuting command via second handle...")
-        execution = await box2.exec("echo", ["Via second handle"])
-        stdout = execution.stdout()
-        async for line in stdout:
+        stdout, exit_code = await run(box2, "echo", "Via second handle")
+        for line in stdout.splitlines():
             print(f"  {line.strip()}")
-        result = await execution.wait()
-        print(f"  Command executed (exit code: {result.exit_code})")
+        print(f"  Command executed (exit code: {exit_code})")
 
         # Clean up - stop via first handle, then remove
         print("\nCleaning up...")
-        await box.stop()
+        await stop_and_remove(runtime, box)
         box = None
         box2 = None  # Both handles now invalid
-        await runtime.remove(box_id, force=False)
         print("  Box stopped and removed")
 
     except Exception as e:
@@ -221,8 +245,7 @@ async def test_lifecycle_combinations():
     print(f"Created box: {box_id}")
 
     # Execute initial command
-    execution = await box.exec("echo", ["Initial"])
-    await execution.wait()
+    await run(box, "echo", "Initial")
     print("  Initial command executed")
 
     # Stop
@@ -236,8 +259,7 @@ async def test_lifecycle_combinations():
 
     # Restart via get + exec
     box = await runtime.get(box_id)
-    execution = await box.exec("echo", ["Restart 1"])
-    await execution.wait()
+    await run(box, "echo", "Restart 1")
     print("  Restarted (1)")
 
     # Stop again
@@ -246,13 +268,11 @@ async def test_lifecycle_combinations():
 
     # Restart again
     box = await runtime.get(box_id)
-    execution = await box.exec("echo", ["Restart 2"])
-    await execution.wait()
+    await run(box, "echo", "Restart 2")
     print("  Restarted (2)")
 
     # Stop and remove
-    await box.stop()
-    await runtime.remove(box_id, force=False)
+    await stop_and_remove(runtime, box)
     print("  Removed")
 
     print("\n  Combination test completed")
@@ -273,8 +293,7 @@ async def test_force_remove():
     print(f"Created box: {box_id}")
 
     # Execute to make it running
-    execution = await box.exec("echo", ["Running"])
-    await execution.wait()
+    await run(box, "echo", "Running")
 
     info = await runtime.get_info(box_id)
     print(f"Box state: {info.state}")
@@ -338,11 +357,15 @@ async def main():
     print("  - Remove: Completely remove box (runtime.remove)")
     print("  - Force Remove: Stop and remove in one call")
 
-    await test_stop_and_restart()
-    await test_reattach_to_running()
-    await test_lifecycle_combinations()
-    await test_force_remove()
-    await test_error_cases()
+    # Each test works on its own box, so run them concurrently. Their
+    # output interleaves, but total time is the slowest test, not the sum.
+    await asyncio.gather(
+        test_stop_and_restart(),
+        test_reattach_to_running(),
+        test_lifecycle_combinations(),
+        test_force_remove(),
+        test_error_cases(),
+    )
 
     print("\n" + "=" * 60)
     print("  All lifecycle tests completed!")
@@ -355,4 +378,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop is optional; when installed it replaces the default event loop
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
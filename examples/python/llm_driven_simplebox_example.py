@@ -12,11 +12,44 @@ Demonstrates how to let an LLM explore a sandbox via tool calls:
 import asyncio
 import json
 import os
+import weakref
 from contextlib import AsyncExitStack
 
 import boxlite
+import httpx
 from openai import AsyncOpenAI
 
+# orjson is optional; it serializes large tool outputs several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    def json_dumps(obj):
+        return orjson.dumps(obj).decode()
+
+    json_loads = orjson.loads
+else:
+    json_dumps = json.dumps
+    json_loads = json.loads
+
+SYSTEM_INSTRUCTIONS = (
+    'You are a powerful autonomous coding assistant.\n'
+    'You can plan, explain, and iterate freely.\n'
+    'When you need to interact with the environment, call sandbox_exec.\n'
+    'Be careful and iterative; do not run destructive commands.\n'
+    'Stop when you are done and summarize.\n'
+)
+
+# Upper bound on concurrent sandbox_exec calls per box. Tool calls fan out
+# across rounds and agents; past a handful of parallel execs the guest only
+# spends more time switching between them.
+GUEST_PARALLELISM = 8
+
+# Set BOXLITE_VERBOSE=0 to skip printing (and formatting) each round's tool calls
+VERBOSE = os.getenv('BOXLITE_VERBOSE', '1') != '0'
+
 TOOLS = [
     {
         'type': 'function',
@@ -36,6 +69,18 @@ TOOLS = [
     }
 ]
 
+_TEXT_TYPES = frozenset({'output_text', 'text'})
+
+# Commands whose output only depends on sandbox state, so repeating them with
+# the same argv is answered from the per-box cache instead of the guest.
+# ``env`` is only read-only without arguments, since ``env CMD`` runs CMD.
+READONLY_CMDS = frozenset({'ls', 'cat', 'which', 'printenv', 'id', 'pwd', 'uname'})
+READONLY_ARGV = frozenset({
+    ('env',),
+    ('python', '--version'), ('python', '-V'),
+    ('python3', '--version'), ('python3', '-V'),
+})
+
 
 def build_client():
     api_key = os.getenv('OPENAI_API_KEY')
@@ -44,7 +89,48 @@ def build_client():
             "OPENAI_API_KEY is not set. Export it before running, e.g.: "
             "`export OPENAI_API_KEY=sk-...`"
         )
-    return AsyncOpenAI(api_key=api_key)
+    # Keep connections alive across agent rounds so each responses.create()
+    # reuses an open TCP/TLS session instead of handshaking again.
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_keepalive_connections=20,
+            max_connections=100,
+            keepalive_expiry=30.0,
+        ),
+        timeout=httpx.Timeout(60.0, connect=5.0),
+    )
+    return AsyncOpenAI(api_key=api_key, http_client=http_client)
+
+
+_exec_semaphores = weakref.WeakKeyDictionary()
+
+
+def exec_semaphore(box):
+    """Return the semaphore bounding concurrent execs on ``box``."""
+    sem = _exec_semaphores.get(box)
+    if sem is None:
+        sem = _exec_semaphores[box] = asyncio.Semaphore(GUEST_PARALLELISM)
+    return sem
+
+
+_exec_caches = weakref.WeakKeyDictionary()
+
+
+def exec_cache(box):
+    """Return the read-only command cache shared by every agent on ``box``."""
+    cache = _exec_caches.get(box)
+    if cache is None:
+        cache = _exec_caches[box] = {}
+    return cache
+
+
+# Bumped whenever a command that may change the sandbox starts or finishes,
+# so a read-only result can tell whether it is still current.
+_exec_generations = weakref.WeakKeyDictionary()
+
+
+def bump_generation(box):
+    _exec_generations[box] = _exec_generations.get(box, 0) + 1
 
 
 async def sandbox_exec(box, argv):
@@ -53,7 +139,8 @@ async def sandbox_exec(box, argv):
     """
     if not argv:
         return {'stdout': '', 'stderr': 'argv is required.', 'exit_code': 2}
-    result = await box.exec(*argv)
+    async with exec_semaphore(box):
+        result = await box.exec(*argv)
     return {
         'stdout': result.stdout,
         'stderr': result.stderr,
@@ -61,66 +148,180 @@ async def sandbox_exec(box, argv):
     }
 
 
-async def whip_agent(box, client, user_goal, model='gpt-5.2', max_rounds=12):
-    system_instructions = (
-        'You are a powerful autonomous coding assistant.\n'
-        'You can plan, explain, and iterate freely.\n'
-        'When you need to interact with the environment, call sandbox_exec.\n'
-        'Be careful and iterative; do not run destructive commands.\n'
-        'Stop when you are done and summarize.\n'
-    )
+def is_readonly(argv):
+    return argv[0] in READONLY_CMDS or tuple(argv) in READONLY_ARGV
+
+
+async def cached_sandbox_exec(box, argv, cache):
+    """sandbox_exec with memoization of read-only commands.
+
+    Any other command may change the sandbox, so it clears the cache and
+    bumps the box's generation both before it starts and once it has
+    finished. A read-only result is only cached if no such command started or
+    finished while it ran, so output read before a change is never served
+    after it.
+    """
+    if not argv:
+        return await sandbox_exec(box, argv)
+
+    key = tuple(argv)
+    if not is_readonly(argv):
+        bump_generation(box)
+        cache.clear()
+        try:
+            return await sandbox_exec(box, argv)
+        finally:
+            bump_generation(box)
+            cache.clear()
+    if key in cache:
+        return cache[key]
+
+    generation = _exec_generations.get(box, 0)
+    out = await sandbox_exec(box, argv)
+    if out['exit_code'] == 0 and _exec_generations.get(box, 0) == generation:
+        cache[key] = out
+    return out
+
 
+def call_argv(call):
+    """Return the argv a sandbox_exec function call asks for."""
+    try:
+        args = json_loads(call.arguments or '{}')
+    except Exception:
+        args = {}
+    return args.get('argv', [])
+
+
+async def run_tool_call(box, call, cache, after=()):
+    """Run one sandbox_exec function call and return its output payload.
+
+    The call waits for the tasks in ``after`` to finish before it starts.
+    """
+    if after:
+        await asyncio.wait(after)
+    argv = call_argv(call)
+    if not isinstance(argv, list):
+        return {'stdout': '', 'stderr': 'Invalid argv; expected a list of strings.', 'exit_code': 2}
+    return await cached_sandbox_exec(box, argv, cache)
+
+
+def require_call_id(call):
+    try:
+        call_id = call.call_id
+    except AttributeError:
+        call_id = None
+    if not call_id:
+        raise RuntimeError(f'Tool call missing call_id: {call}')
+    return call_id
+
+
+async def cancel_tasks(tasks):
+    """Cancel the given tool call tasks and wait for them to unwind."""
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def stream_round(client, box, cache, dispatch=True, **request):
+    """Stream one model turn, starting each tool call as soon as it is complete.
+
+    Tool calls run in the sandbox while the model is still generating the rest
+    of the turn, instead of waiting for the whole response first. Read-only
+    calls run concurrently; a call that may change the sandbox waits for every
+    call before it, and the calls after it wait for it, so the model's order
+    holds wherever it matters. With ``dispatch=False`` nothing is started,
+    for a turn whose calls will never be answered.
+
+    Returns:
+        Tuple of (response, tasks) where tasks maps call_id to its running call
+    """
+    tasks = {}
+    # Tasks the next read-only call must wait for: the last mutating call.
+    barrier = ()
+    try:
+        async with client.responses.stream(**request) as stream:
+            async for event in stream:
+                if not dispatch or event.type != 'response.output_item.done':
+                    continue
+                item = event.item
+                if item.type != 'function_call':
+                    continue
+                argv = call_argv(item)
+                mutating = isinstance(argv, list) and argv and not is_readonly(argv)
+                after = tuple(tasks.values()) if mutating else barrier
+                task = asyncio.create_task(run_tool_call(box, item, cache, after))
+                tasks[require_call_id(item)] = task
+                if mutating:
+                    barrier = (task,)
+            response = await stream.get_final_response()
+    except BaseException:
+        await cancel_tasks(tasks.values())
+        raise
+    return response, tasks
+
+
+async def whip_agent(box, client, user_goal, model='gpt-5.2', max_rounds=12):
     print('\n[User Goal]\n', user_goal)
 
-    response = await client.responses.create(
+    response, tasks = await stream_round(
+        client,
+        box,
+        exec_cache(box),
         model=model,
-        instructions=system_instructions,
+        instructions=SYSTEM_INSTRUCTIONS,
         input=[{'role': 'user', 'content': user_goal}],
         tools=TOOLS,
         tool_choice='auto',
     )
 
-    for _ in range(max_rounds):
+    for round_no in range(max_rounds):
+        # One pass over the output: print messages and collect tool calls.
+        # The list is only created once a call shows up, so text-only rounds
+        # (typical at the end of a session) exit without allocating it.
+        calls = None
         for item in response.output:
-            if item.type == 'message':
+            item_type = item.type
+            if item_type == 'message':
                 for content in item.content:
-                    if content.type in ('output_text', 'text'):
+                    if content.type in _TEXT_TYPES:
                         print('\n[LLM]\n', content.text)
+            elif item_type == 'function_call':
+                if calls is None:
+                    calls = []
+                calls.append(item)
 
-        calls = [item for item in response.output if item.type == 'function_call']
-        if not calls:
+        if calls is None:
             return response
-        else:
+        if VERBOSE:
             call_info = '\n'.join(
                 f"  -> name={call.name!r}, arguments={call.arguments!r}"
                 for call in calls
             )
             print(f"\n[System] Executing tool calls: {call_info}")
 
-        outputs = []
-        for call in calls:
-            try:
-                args = json.loads(call.arguments or '{}')
-            except Exception:
-                args = {}
+        # The calls were started while the response streamed in, ordered
+        # around any mutating ones; wait for all of them to finish
+        try:
+            results = await asyncio.gather(*(tasks[call.call_id] for call in calls))
+        except BaseException:
+            await cancel_tasks(tasks.values())
+            raise
 
-            argv = args.get('argv', [])
-            if not isinstance(argv, list):
-                out = {'stdout': '', 'stderr': 'Invalid argv; expected a list of strings.', 'exit_code': 2}
-            else:
-                out = await sandbox_exec(box, argv)
-
-            call_id = getattr(call, 'call_id', None)
-            if not call_id:
-                raise RuntimeError(f'Tool call missing call_id: {call}')
-
-            outputs.append({
+        outputs = [
+            {
                 'type': 'function_call_output',
-                'call_id': call_id,
-                'output': json.dumps(out),
-            })
+                'call_id': call.call_id,
+                'output': json_dumps(out),
+            }
+            for call, out in zip(calls, results)
+        ]
 
-        response = await client.responses.create(
+        response, tasks = await stream_round(
+            client,
+            box,
+            exec_cache(box),
+            # Calls from the last round would never be reported back.
+            dispatch=round_no < max_rounds - 1,
             model=model,
             previous_response_id=response.id,
             input=outputs,
@@ -133,24 +334,37 @@ async def whip_agent(box, client, user_goal, model='gpt-5.2', max_rounds=12):
 
 
 async def main():
-    client = build_client()
-
     stack = AsyncExitStack()
-    box = await stack.enter_async_context(boxlite.SimpleBox(image='python:slim'))
+    # Closing the OpenAI client also closes its pooled httpx client
+    client = await stack.enter_async_context(build_client())
     try:
-        await whip_agent(
-            box,
-            client,
-            'Explore this sandbox. Show python version, installed packages, $PATH and list files. '
-            'Then run a short python snippet that prints system info. '
-            'Finally give a human readable report.',
-        )
+        box = await stack.enter_async_context(boxlite.SimpleBox(image='python:slim'))
 
-        await whip_agent(
-            box,
-            client,
-            'What commands (executables) are available in this sandbox? Show them all, split by commas.',
-        )
+        # Run both agent sessions concurrently to overlap their LLM round
+        # trips. Calls are only ordered within one agent's round: the goals
+        # below don't touch each other's files, but agents with conflicting
+        # goals would need a box of their own.
+        agents = [
+            asyncio.create_task(whip_agent(
+                box,
+                client,
+                'Explore this sandbox. Show python version, installed packages, $PATH and list files. '
+                'Then run a short python snippet that prints system info. '
+                'Finally give a human readable report.',
+            )),
+            asyncio.create_task(whip_agent(
+                box,
+                client,
+                'What commands (executables) are available in this sandbox? Show them all, split by commas.',
+            )),
+        ]
+        try:
+            await asyncio.gather(*agents)
+        except BaseException:
+            # Stop the other agent before the box and client are closed
+            # under it.
+            await cancel_tasks(agents)
+            raise
     finally:
         await stack.aclose()
 
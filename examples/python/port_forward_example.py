@@ -5,16 +5,36 @@ Port forwarding test — verify that a guest service is reachable from the host.
 Starts a simple HTTP server inside a box on port 18789,
 then curls it from the host on 127.0.0.1:18789.
 
+Requirements:
+    pip install boxlite httpx
+
 Usage:
     python examples/python/port_forward_example.py
 """
 
 import asyncio
-import urllib.request
 
+import httpx
 from boxlite import SimpleBox
 
 
+async def wait_ready(client, url, timeout=5.0):
+    """Poll ``url`` until it answers and return the HTTP status.
+
+    Returns as soon as the server is up instead of sleeping a fixed amount.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        try:
+            resp = await client.get(url)
+            return resp.status_code
+        except httpx.TransportError:
+            if loop.time() >= deadline:
+                raise
+            await asyncio.sleep(0.05)
+
+
 async def main():
     async with SimpleBox(
         image="python:alpine",
@@ -33,16 +53,16 @@ async def main():
             "nohup python -m http.server 18789 --bind 0.0.0.0 "
             "> /dev/null 2>&1 &"
         )
-        await asyncio.sleep(1)  # let the server start
 
-        # Verify from the host
-        try:
-            with urllib.request.urlopen(
-                "http://127.0.0.1:18789/", timeout=5
-            ) as resp:
-                print(f"Host -> guest: HTTP {resp.status}")
-        except Exception as e:
-            print(f"Host -> guest FAILED: {e}")
+        # Verify from the host by polling over HTTP until the guest server
+        # answers. A TCP probe can't stand in for this: the host-side
+        # forwarder accepts connections before the guest server is listening.
+        async with httpx.AsyncClient(timeout=0.5) as client:
+            try:
+                status = await wait_ready(client, "http://127.0.0.1:18789/")
+                print(f"Host -> guest: HTTP {status}")
+            except Exception as e:
+                print(f"Host -> guest FAILED: {e}")
 
 
 if __name__ == "__main__":
@@ -4,60 +4,129 @@ Workaround (sync): copy files into tmpfs destinations inside a container.
 Synchronous version of cp_tmpfs_workaround_example.py.
 See that file for background on the tmpfs limitation.
 
+copy_files() always goes through tar-over-stdin, which works for tmpfs and
+rootfs destinations alike and needs no temporary file on the host.
+
 Requirements:
   pip install boxlite[sync]
 """
 
+import functools
 import io
-import os
 import tarfile
-import tempfile
 
 from boxlite import SyncSimpleBox
 
+# Archives up to this size are built in memory ahead of time (and cached);
+# larger ones are streamed into stdin so they never sit in memory as a whole.
+STREAM_THRESHOLD = 1024 * 1024
+
 
 def make_tar(files: dict[str, bytes]) -> bytes:
-    """Create an in-memory tar archive from a dict of {path: content}."""
-    buf = io.BytesIO()
-    with tarfile.open(fileobj=buf, mode="w") as tar:
+    """Create an in-memory tar archive from a dict of {path: content}.
+
+    The same file set is often copied into many boxes, so archives are cached
+    by content and only serialized once.
+    """
+    return _make_tar_cached(tuple(files.items()))
+
+
+@functools.lru_cache(maxsize=32)
+def _make_tar_cached(entries: tuple[tuple[str, bytes], ...]) -> bytes:
+    buf = bytearray()
+    for name, data in entries:
+        buf += _ustar_header(name, len(data))
+        buf += data
+        buf += bytes(-len(data) % tarfile.BLOCKSIZE)
+    # End-of-archive marker: two zero blocks
+    buf += bytes(2 * tarfile.BLOCKSIZE)
+    return bytes(buf)
+
+
+def _ustar_header(name: str, size: int) -> bytes:
+    """Build the 512-byte ustar header of a regular 0644 file owned by root.
+
+    Every field except name, size and checksum is fixed, so this skips the
+    generic TarInfo bookkeeping. Names that don't fit the 100-byte name field
+    go through tarfile, which stores them in a PAX extended header.
+    """
+    encoded = name.encode()
+    if len(encoded) > 100:
+        info = tarfile.TarInfo(name=name)
+        info.size = size
+        return info.tobuf()
+
+    header = bytearray(tarfile.BLOCKSIZE)
+    header[0:len(encoded)] = encoded
+    header[100:108] = b"0000644\0"            # mode
+    header[108:116] = b"0000000\0"            # uid
+    header[116:124] = b"0000000\0"            # gid
+    header[124:136] = b"%011o\0" % size       # size
+    header[136:148] = b"00000000000\0"        # mtime
+    header[148:156] = b" " * 8                # checksum placeholder
+    header[156:157] = tarfile.REGTYPE
+    header[257:265] = tarfile.POSIX_MAGIC     # "ustar\0" + version "00"
+    header[148:156] = b"%06o\0 " % sum(header)
+    return bytes(header)
+
+
+class _StdinWriter:
+    """File-like sink that forwards every write straight to an execution's stdin."""
+
+    def __init__(self, stdin):
+        self._stdin = stdin
+
+    def write(self, data: bytes) -> int:
+        self._stdin.send_input(data)
+        return len(data)
+
+
+def stream_tar(files: dict[str, bytes], stdin, chunk_size: int = 64 * 1024) -> None:
+    """Stream a tar archive of {path: content} into stdin.
+
+    tarfile's streaming mode ("w|") emits the archive in ``chunk_size``
+    blocks as it is built, so it is never held in memory as a whole.
+    """
+    with tarfile.open(fileobj=_StdinWriter(stdin), mode="w|", bufsize=chunk_size) as tar:
         for name, data in files.items():
             info = tarfile.TarInfo(name=name)
             info.size = len(data)
             tar.addfile(info, io.BytesIO(data))
-    return buf.getvalue()
+
+
+def copy_files(box, files: dict[str, bytes], dest: str = "/") -> int:
+    """Copy in-memory files into the box by piping a tar archive to `tar xf -`.
+
+    Unlike copy_in(), extraction runs inside the container's mount namespace,
+    so files under tmpfs mounts such as /tmp are visible to the container.
+
+    Returns:
+        Exit code of tar inside the box
+    """
+    # Use low-level SyncBox to get stdin access
+    execution = box._box.exec("tar", ["xf", "-", "-C", dest])
+    stdin = execution.stdin()
+    if sum(len(data) for data in files.values()) <= STREAM_THRESHOLD:
+        stdin.send_input(make_tar(files))
+    else:
+        stream_tar(files, stdin)
+    stdin.close()
+    return execution.wait().exit_code
 
 
 def main():
+    files = {
+        "tmp/ghost.txt": b"now you see me\n",
+        "tmp/hello.txt": b"visible!\n",
+    }
+
     with SyncSimpleBox("alpine:latest", name="sync-tmpfs-cp-demo") as box:
+        exit_code = copy_files(box, files, dest="/")
+        print(f"tar via stdin:       exit={exit_code}")
 
-        # --- The problem: copy_in to /tmp silently fails ---
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("you won't see me\n")
-            host_file = f.name
-
-        try:
-            # SyncSimpleBox doesn't expose copy_in directly; use the
-            # underlying SyncBox._sync helper to call PyBox.copy_in.
-            box._box._sync(box._box._box.copy_in(host_file, "/tmp/ghost.txt"))
-            result = box.exec("ls", "/tmp/ghost.txt")
-            print(f"copy_in to /tmp:     exit={result.exit_code}  "
-                  f"{'FOUND' if result.exit_code == 0 else 'NOT FOUND (expected)'}")
-        finally:
-            os.unlink(host_file)
-
-        # --- The workaround: pipe tar through container process ---
-        tar_data = make_tar({"hello.txt": b"visible!\n"})
-
-        # Use low-level SyncBox to get stdin access
-        execution = box._box.exec("tar", ["xf", "-", "-C", "/tmp"])
-        stdin = execution.stdin()
-        stdin.send_input(tar_data)
-        stdin.close()
-        result = execution.wait()
-        print(f"tar via stdin:       exit={result.exit_code}")
-
-        result = box.exec("cat", "/tmp/hello.txt")
-        print(f"read /tmp/hello.txt: {result.stdout.strip()}")
+        for path in ("/tmp/ghost.txt", "/tmp/hello.txt"):
+            result = box.exec("cat", path)
+            print(f"read {path}: {result.stdout.strip()}")
 
 
 if __name__ == "__main__":
@@ -88,6 +88,10 @@ class SyncExecStdout:
         except StopAsyncIteration:
             raise StopIteration
 
+    def read_all(self) -> str:
+        """Read stdout to EOF and return it as one string."""
+        return self._sync(self._async_stdout.read_all())
+
 
 class SyncExecStderr:
     """
@@ -133,6 +137,10 @@ class SyncExecStderr:
         except StopAsyncIteration:
             raise StopIteration
 
+    def read_all(self) -> str:
+        """Read stderr to EOF and return it as one string."""
+        return self._sync(self._async_stderr.read_all())
+
 
 class SyncExecution:
     """
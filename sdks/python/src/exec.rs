@@ -30,6 +30,24 @@ impl PyExecStdout {
         Ok(Some(future))
     }
 
+    /// Read the stream to EOF and return everything as one string.
+    ///
+    /// Chunks are joined on the Rust side, so Python awaits once instead of
+    /// once per chunk.
+    fn read_all<'a>(&self, py: Python<'a>) -> PyResult<Bound<'a, PyAny>> {
+        let stream = Arc::clone(&self.stream);
+
+        pyo3_async_runtimes::tokio::future_into_py(py, async move {
+            use futures::StreamExt;
+            let mut guard = stream.lock().await;
+            let mut output = String::new();
+            while let Some(chunk) = guard.next().await {
+                output.push_str(&chunk);
+            }
+            Ok(output)
+        })
+    }
+
     fn __repr__(&self) -> String {
         "ExecStdout(...)".to_string()
     }
@@ -105,6 +123,24 @@ impl PyExecStderr {
         Ok(Some(future))
     }
 
+    /// Read the stream to EOF and return everything as one string.
+    ///
+    /// Chunks are joined on the Rust side, so Python awaits once instead of
+    /// once per chunk.
+    fn read_all<'a>(&self, py: Python<'a>) -> PyResult<Bound<'a, PyAny>> {
+        let stream = Arc::clone(&self.stream);
+
+        pyo3_async_runtimes::tokio::future_into_py(py, async move {
+            use futures::StreamExt;
+            let mut guard = stream.lock().await;
+            let mut output = String::new();
+            while let Some(chunk) = guard.next().await {
+                output.push_str(&chunk);
+            }
+            Ok(output)
+        })
+    }
+
     fn __repr__(&self) -> String {
         "ExecStderr(...)".to_string()
     }
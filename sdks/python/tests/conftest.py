@@ -58,3 +58,73 @@ def shared_sync_runtime(shared_runtime):
     rt.start()  # Start greenlet machinery
     yield rt
     rt.stop()  # Stop greenlet machinery (doesn't close the shared runtime)
+
+
+class SyncSandboxPool:
+    """Hands out running alpine boxes and takes them back for reuse.
+
+    Tests that only exec into a default box can share VMs instead of paying
+    a cold start each. Tests that depend on create options, stop(), or
+    auto_remove semantics should create their own box.
+
+    Boxes are created on demand from the test thread: the sync runtime's
+    greenlet machinery is not safe to drive from a background thread.
+    """
+
+    IMAGE = "alpine:latest"
+
+    def __init__(self, runtime):
+        self._runtime = runtime
+        self._idle = []
+        self._boxes = []
+
+    def acquire(self):
+        """Return an idle box, creating one if the pool is empty."""
+        if self._idle:
+            return self._idle.pop()
+        box = self._runtime.create(boxlite.BoxOptions(image=self.IMAGE))
+        self._boxes.append(box)
+        return box
+
+    def release(self, box):
+        """Reset scratch state and return the box to the pool.
+
+        A box that cannot be reset is stopped instead of being reused.
+        """
+        try:
+            execution = box.exec("sh", ["-c", "rm -rf /tmp/* /tmp/.[!.]*"])
+            if execution.wait().exit_code == 0:
+                self._idle.append(box)
+                return
+        except Exception:
+            pass
+        self._discard(box)
+
+    def close(self):
+        """Stop every box the pool created."""
+        for box in list(self._boxes):
+            self._discard(box)
+        self._idle.clear()
+
+    def _discard(self, box):
+        self._boxes.remove(box)
+        try:
+            box.stop()
+        except Exception:
+            pass
+
+
+@pytest.fixture(scope="session")
+def sync_sandbox_pool(shared_sync_runtime):
+    """Session-scoped pool of reusable alpine boxes for sync tests."""
+    pool = SyncSandboxPool(shared_sync_runtime)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def pooled_sync_box(sync_sandbox_pool):
+    """A running alpine box borrowed from the pool for one test."""
+    box = sync_sandbox_pool.acquire()
+    yield box
+    sync_sandbox_pool.release(box)
@@ -56,84 +56,50 @@ class TestBoxOptionsDefaults:
         assert opts.detach is False
 
 
-class TestAutoRemoveBehavior:
-    """Test auto_remove option behavior."""
-
-    def test_auto_remove_true_removes_box_on_stop(self, runtime):
-        """Test that auto_remove=True removes box when stop() is called."""
+class TestStopBehavior:
+    """Test what stop() does for each auto_remove/detach combination."""
+
+    @pytest.mark.parametrize(
+        "auto_remove,detach,expect_removed",
+        [
+            # Ephemeral sandbox: removed as soon as it stops
+            pytest.param(True, False, True, id="ephemeral-sandbox"),
+            # Persistent sandbox: preserved for restart
+            pytest.param(False, False, False, id="persistent-sandbox"),
+            # Detached service: preserved, survives parent exit
+            pytest.param(False, True, False, id="detached-service"),
+        ],
+    )
+    def test_stop(self, runtime, auto_remove, detach, expect_removed):
+        """Test that stop() removes or preserves the box as configured."""
         box = runtime.create(
             boxlite.BoxOptions(
                 image="alpine:latest",
-                auto_remove=True,
+                auto_remove=auto_remove,
+                detach=detach,
             )
         )
         box_id = box.id
+        assert box_id is not None
 
         # Box should exist before stop
         assert runtime.get_info(box_id) is not None
 
-        # Stop the box
         box.stop()
 
-        # Box should be removed
-        assert runtime.get_info(box_id) is None
-
-    def test_auto_remove_false_preserves_box_on_stop(self, runtime):
-        """Test that auto_remove=False preserves box when stop() is called."""
-        box = runtime.create(
-            boxlite.BoxOptions(
-                image="alpine:latest",
-                auto_remove=False,
-            )
-        )
-        box_id = box.id
-
-        # Stop the box
-        box.stop()
-
-        # Box should still exist
         info = runtime.get_info(box_id)
+        if expect_removed:
+            assert info is None
+            return
+
         assert info is not None
         assert info.state.status == "stopped"
 
-        # Cleanup
-        runtime.remove(box_id)
-
-
-class TestDetachOption:
-    """Test detach option is accepted."""
-
-    def test_detach_false_creates_box(self, runtime):
-        """Test that detach=False creates box successfully."""
-        box = runtime.create(
-            boxlite.BoxOptions(
-                image="alpine:latest",
-                detach=False,
-                auto_remove=True,
-            )
-        )
-        assert box is not None
-        assert box.id is not None
-
-        # Cleanup
-        box.stop()
-
-    def test_detach_true_creates_box(self, runtime):
-        """Test that detach=True creates box successfully."""
-        # Note: detach=True requires auto_remove=False (they are incompatible)
-        box = runtime.create(
-            boxlite.BoxOptions(
-                image="alpine:latest",
-                detach=True,
-                auto_remove=False,
-            )
-        )
-        assert box is not None
-        assert box.id is not None
+        # Can get new handle
+        assert runtime.get(box_id) is not None
 
-        # Cleanup
-        box.stop()
-        runtime.remove(box.id)
+        # Cleanup - box is already stopped, just remove it
+        runtime.remove(box_id)
 
 
 class TestInvalidCombinations:
@@ -155,80 +121,6 @@ class TestInvalidCombinations:
         assert "incompatible" in str(exc_info.value).lower()
 
 
-class TestCombinedOptions:
-    """Test combinations of auto_remove and detach options."""
-
-    def test_ephemeral_sandbox(self, runtime):
-        """Test ephemeral sandbox: auto_remove=True, detach=False."""
-        box = runtime.create(
-            boxlite.BoxOptions(
-                image="alpine:latest",
-                auto_remove=True,
-                detach=False,
-            )
-        )
-        box_id = box.id
-
-        # Box exists
-        assert runtime.get_info(box_id) is not None
-
-        # Stop - should auto-remove
-        box.stop()
-
-        # Box gone
-        assert runtime.get_info(box_id) is None
-
-    def test_persistent_sandbox(self, runtime):
-        """Test persistent sandbox: auto_remove=False, detach=False."""
-        box = runtime.create(
-            boxlite.BoxOptions(
-                image="alpine:latest",
-                auto_remove=False,
-                detach=False,
-            )
-        )
-        box_id = box.id
-
-        # Stop - should preserve
-        box.stop()
-
-        # Box still exists
-        info = runtime.get_info(box_id)
-        assert info is not None
-        assert info.state.status == "stopped"
-
-        # Can get new handle
-        box2 = runtime.get(box_id)
-        assert box2 is not None
-
-        # Cleanup - box is already stopped, just remove it
-        runtime.remove(box_id)
-
-    def test_detached_service(self, runtime):
-        """Test detached service: auto_remove=False, detach=True."""
-        box = runtime.create(
-            boxlite.BoxOptions(
-                image="alpine:latest",
-                auto_remove=False,
-                detach=True,
-            )
-        )
-        box_id = box.id
-
-        # Box exists
-        assert runtime.get_info(box_id) is not None
-
-        # Stop
-        box.stop()
-
-        # Still exists (auto_remove=False)
-        info = runtime.get_info(box_id)
-        assert info is not None
-
-        # Cleanup
-        runtime.remove(box_id)
-
-
 class TestCmdAndUserOptions:
     """Test cmd and user override options."""
 
@@ -127,6 +127,40 @@ class TestSimpleBoxExec:
             assert result.exit_code == 42
 
 
+class TestExecStreamReadAll:
+    """Test ExecStdout.read_all() and ExecStderr.read_all()."""
+
+    @pytest.mark.asyncio
+    async def test_stdout_read_all(self, shared_runtime):
+        """Test reading all of stdout in one call."""
+        async with boxlite.SimpleBox(
+            image="alpine:latest", runtime=shared_runtime
+        ) as box:
+            execution = await box._box.exec(
+                "sh", ["-c", "echo line1; echo line2; echo line3"]
+            )
+            output = await execution.stdout().read_all()
+            assert output.splitlines() == ["line1", "line2", "line3"]
+
+            result = await execution.wait()
+            assert result.exit_code == 0
+
+    @pytest.mark.asyncio
+    async def test_stderr_read_all(self, shared_runtime):
+        """Test reading all of stderr in one call."""
+        async with boxlite.SimpleBox(
+            image="alpine:latest", runtime=shared_runtime
+        ) as box:
+            execution = await box._box.exec(
+                "sh", ["-c", "echo err1 >&2; echo err2 >&2"]
+            )
+            output = await execution.stderr().read_all()
+            assert output.splitlines() == ["err1", "err2"]
+
+            result = await execution.wait()
+            assert result.exit_code == 0
+
+
 class TestSimpleBoxEnvironment:
     """Test SimpleBox environment variable handling."""
 
@@ -80,10 +80,9 @@ class TestSyncBox:
         assert info.memory_mib == 256
         box.stop()
 
-    def test_box_exec_simple(self, shared_sync_runtime):
+    def test_box_exec_simple(self, pooled_sync_box):
         """Can run simple command."""
-        box = shared_sync_runtime.create(boxlite.BoxOptions(image="alpine:latest"))
-        execution = box.exec("echo", ["hello", "world"])
+        execution = pooled_sync_box.exec("echo", ["hello", "world"])
 
         stdout_lines = list(execution.stdout())
         assert len(stdout_lines) > 0
@@ -91,24 +90,22 @@ class TestSyncBox:
 
         result = execution.wait()
         assert result.exit_code == 0
-        box.stop()
 
-    def test_box_exec_with_env(self, shared_sync_runtime):
+    def test_box_exec_with_env(self, pooled_sync_box):
         """Can run command with environment variables."""
-        box = shared_sync_runtime.create(boxlite.BoxOptions(image="alpine:latest"))
-        execution = box.exec("sh", ["-c", "echo $MY_VAR"], [("MY_VAR", "test_value")])
+        execution = pooled_sync_box.exec(
+            "sh", ["-c", "echo $MY_VAR"], [("MY_VAR", "test_value")]
+        )
 
         stdout_lines = list(execution.stdout())
         assert any("test_value" in line for line in stdout_lines)
 
         result = execution.wait()
         assert result.exit_code == 0
-        box.stop()
 
-    def test_box_exec_stderr(self, shared_sync_runtime):
+    def test_box_exec_stderr(self, pooled_sync_box):
         """Can capture stderr from command."""
-        box = shared_sync_runtime.create(boxlite.BoxOptions(image="alpine:latest"))
-        execution = box.exec("sh", ["-c", "echo error >&2"])
+        execution = pooled_sync_box.exec("sh", ["-c", "echo error >&2"])
 
         stderr_lines = list(execution.stderr())
         assert len(stderr_lines) > 0
@@ -116,17 +113,14 @@ class TestSyncBox:
 
         result = execution.wait()
         assert result.exit_code == 0
-        box.stop()
 
-    def test_box_exec_nonzero_exit(self, shared_sync_runtime):
+    def test_box_exec_nonzero_exit(self, pooled_sync_box):
         """Command with non-zero exit code is captured."""
-        box = shared_sync_runtime.create(boxlite.BoxOptions(image="alpine:latest"))
-        execution = box.exec("sh", ["-c", "exit 42"])
+        execution = pooled_sync_box.exec("sh", ["-c", "exit 42"])
 
         list(execution.stdout())  # Consume output
         result = execution.wait()
         assert result.exit_code == 42
-        box.stop()
 
     def test_box_metrics(self, shared_sync_runtime):
         """Can get box metrics."""
@@ -163,21 +157,18 @@ class TestSyncBox:
 class TestSyncExecution:
     """Tests for SyncExecution class."""
 
-    def test_execution_id(self, shared_sync_runtime):
+    def test_execution_id(self, pooled_sync_box):
         """Execution has an id."""
-        box = shared_sync_runtime.create(boxlite.BoxOptions(image="alpine:latest"))
-        execution = box.exec("echo", ["test"])
+        execution = pooled_sync_box.exec("echo", ["test"])
 
         assert execution.id is not None
 
         list(execution.stdout())
         execution.wait()
-        box.stop()
 
-    def test_execution_kill(self, shared_sync_runtime):
+    def test_execution_kill(self, pooled_sync_box):
         """Can kill a running execution."""
-        box = shared_sync_runtime.create(boxlite.BoxOptions(image="alpine:latest"))
-        execution = box.exec("sleep", ["100"])
+        execution = pooled_sync_box.exec("sleep", ["100"])
 
         time.sleep(0.5)  # Let it start
         execution.kill()
@@ -185,12 +176,12 @@ class TestSyncExecution:
         result = execution.wait()
         # Killed processes typically have negative exit code (signal)
         assert result.exit_code != 0
-        box.stop()
 
-    def test_stdout_iteration(self, shared_sync_runtime):
+    def test_stdout_iteration(self, pooled_sync_box):
         """Can iterate over stdout synchronously."""
-        box = shared_sync_runtime.create(boxlite.BoxOptions(image="alpine:latest"))
-        execution = box.exec("sh", ["-c", "echo line1; echo line2; echo line3"])
+        execution = pooled_sync_box.exec(
+            "sh", ["-c", "echo line1; echo line2; echo line3"]
+        )
 
         lines = []
         for line in execution.stdout():
@@ -198,7 +189,28 @@ class TestSyncExecution:
 
         assert len(lines) >= 1  # May be combined or separate
         execution.wait()
-        box.stop()
+
+    def test_stdout_read_all(self, pooled_sync_box):
+        """Can read all of stdout in one call."""
+        execution = pooled_sync_box.exec(
+            "sh", ["-c", "echo line1; echo line2; echo line3"]
+        )
+
+        output = execution.stdout().read_all()
+        assert output.splitlines() == ["line1", "line2", "line3"]
+
+        result = execution.wait()
+        assert result.exit_code == 0
+
+    def test_stderr_read_all(self, pooled_sync_box):
+        """Can read all of stderr in one call."""
+        execution = pooled_sync_box.exec("sh", ["-c", "echo err1 >&2; echo err2 >&2"])
+
+        output = execution.stderr().read_all()
+        assert output.splitlines() == ["err1", "err2"]
+
+        result = execution.wait()
+        assert result.exit_code == 0
 
 
 # =============================================================================